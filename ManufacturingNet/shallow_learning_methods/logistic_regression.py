@@ -1,7 +1,37 @@
-from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import accuracy_score, roc_auc_score
-from sklearn.model_selection import train_test_split
+from contextlib import nullcontext
+import warnings
+
+try:
+    # Optional dependency: caps BLAS thread counts so lbfgs fits don't oversubscribe cores
+    # when this wrapper is called from a multiprocessing pool.
+    from threadpoolctl import threadpool_limits
+    _THREADPOOLCTL_AVAILABLE = True
+except ImportError:
+    _THREADPOOLCTL_AVAILABLE = False
+
+try:
+    # Optional dependency: JIT-compiles the accuracy reduction into a single fused compare-and-mean,
+    # skipping scikit-learn's Python-level target validation on every scoring call.
+    from numba import njit
+
+    @njit(cache=True, parallel=True)
+    def _accuracy_kernel(y_pred, y_true):
+        return (y_pred == y_true).mean()
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+try:
+    # Optional dependency: evaluates the sigmoid in a single fused SIMD pass with no temporaries.
+    import numexpr as ne
+    _NUMEXPR_AVAILABLE = True
+except ImportError:
+    _NUMEXPR_AVAILABLE = False
+
 import numpy as np
+import scipy.sparse as sp
+from scipy.special import expit
 
 class LogisticRegression: 
     
@@ -15,7 +45,8 @@ class LogisticRegression:
 
     def __init__(self, attributes=None, labels=None, test_size=0.25, penalty='l2', dual=False, \
                     tol=0.0001, C=1.0, fit_intercept=True, intercept_scaling=1, class_weight=None, random_state=None, \
-                        solver='lbfgs', max_iter=100, multi_class='auto', verbose=0, warm_start=False, n_jobs=None, l1_ratio=None):
+                        solver='lbfgs', max_iter=100, multi_class='auto', verbose=0, warm_start=False, n_jobs=None, l1_ratio=None, \
+                            use_intelex=True, dtype=np.float32):
         
 
         """
@@ -23,7 +54,8 @@ class LogisticRegression:
 
         The following parameters are needed to create a logistic regression model:
 
-            - attributes: a numpy array of the desired independent variables
+            - attributes: a numpy array or scipy.sparse matrix of the desired independent variables; sparse
+            inputs are kept sparse in CSR layout rather than densified
             - labels: a numpy array of the desired dependent variables
             - test_size: the proportion of the dataset to be used for testing the model (defaults to 0.25);
             the proportion of the dataset to be used for training will be the complement of test_size
@@ -38,9 +70,20 @@ class LogisticRegression:
             - multi_class: chooses if we fit a binary problem or a multi-class problem for each label (defaults to auto)
             - verbose: used in the liblinear or lbfgs solvers, where any positive number is set (defaults to 0)
             - warm_start: when set to true, reuse the solution of the previous call to fit as initialization, otherwise, just erase the previous solution (defaults to False)
-            - n_jobs: the number of jobs to use for the computation (defaults to None)
+            - n_jobs: deprecated; upstream scikit-learn is removing its effect on LogisticRegression, so it is
+            no longer forwarded to the estimator. When set (with threadpoolctl installed), it instead caps the
+            BLAS/OpenMP thread pools used during fitting and prediction - the place the actual parallelism
+            lives. Set n_jobs=1 when calling from a multiprocessing pool to avoid thread oversubscription, and
+            leave it as None in single-process use to keep full native parallelism (defaults to None)
             - l1_ratio: this is the Elastic-Net mixing parameter. Setting this to 0 is using l2 penalty, setting this to
-            1 is using l1_penalty and a value between 0 and 1 is a combination of l1 and l2. 
+            1 is using l1_penalty and a value between 0 and 1 is a combination of l1 and l2.
+            - use_intelex: when the Intel Extension for Scikit-learn (sklearnex) is installed, accelerates fitting and
+            prediction through oneDAL for supported solvers (defaults to True); ignored when sklearnex is missing or
+            the solver is 'saga', which sklearnex doesn't support. class_weight='balanced' fits stay eligible because
+            the balanced weights are precomputed as sample weights rather than passed to the estimator
+            - dtype: the floating-point type attributes are coerced to before fitting (defaults to np.float32);
+            float32 halves memory traffic versus float64 and is roughly twice as fast through the solver's BLAS
+            kernels, but pass np.float64 if your data needs the extra precision
 
         The following instance data is found after successfully running linear_regression():
 
@@ -75,7 +118,17 @@ class LogisticRegression:
         self.verbose = verbose
         self.warm_start = warm_start
         self.n_jobs = n_jobs
+        if n_jobs is not None:
+            warnings.warn("n_jobs is deprecated and no longer forwarded to scikit-learn's "
+                          "LogisticRegression; it now only caps the BLAS/OpenMP thread pools "
+                          "used during fitting and prediction.", DeprecationWarning)
         self.l1_ratio = l1_ratio
+        self.use_intelex = use_intelex
+        self.dtype = dtype
+
+        self._split_cache = None
+        self._inputs_ok = None
+        self._X_test_cached = None
 
         self.regression = None
         self.classes_ = None
@@ -167,6 +220,8 @@ class LogisticRegression:
         Input should be a populated numpy array of the desired independent variables.
         """
         self.attributes = new_attributes
+        self._inputs_ok = None
+        self._split_cache = None
 
     def set_labels(self, new_labels = None):
         """
@@ -175,6 +230,8 @@ class LogisticRegression:
         Input should be a populated numpy array of the desired dependent variables.
         """
         self.labels = new_labels
+        self._inputs_ok = None
+        self._split_cache = None
 
     def set_test_size(self, new_test_size = None):
         """
@@ -183,6 +240,8 @@ class LogisticRegression:
         Input should be a number or None.
         """
         self.test_size  = new_test_size
+        self._inputs_ok = None
+        self._split_cache = None
 
 
     # Wrapper for logistic regression model
@@ -192,20 +251,116 @@ class LogisticRegression:
         Performs logistic regression on dataset using scikit-learn's logistic_model and returns the resultant array of
         coefficients.
         """
-        if self._check_inputs():
-            # Instantiate LogisticRegression() object
-            self.regression = LogisticRegression(penalty=self.penalty, dual=self.dual, tol=self.tol, \
-                C=self.C, fit_intercept=self.fit_intercept, intercept_scaling=self.intercept_scaling, class_weight=self.class_weight, \
-                    random_state=self.random_state, solver=self.solver, max_iter=self.max_iter, multi_class=self.multi_class, \
-                        verbose=self.verbose, warm_start=self.warm_start, n_jobs=self.n_jobs, l1_ratio=self.l1_ratio)
+        # scikit-learn and joblib are imported here rather than at module scope, so short-lived
+        # callers that only construct the object or read stored results don't pay their several-
+        # hundred-millisecond import cost; the first fit pays it once
+        from joblib import parallel_backend
+        from sklearn.linear_model import LogisticRegression as _SKLogisticRegression
+        from sklearn.metrics import accuracy_score, roc_auc_score
+        from sklearn.model_selection import ShuffleSplit, StratifiedShuffleSplit
+        from sklearn.utils.class_weight import compute_sample_weight
+
+        try:
+            # Optional dependency: Intel Extension for Scikit-learn. When installed, patching routes
+            # LogisticRegression's fit/predict for supported solvers to oneDAL kernels.
+            from sklearnex import patch_sklearn
+            sklearnex_available = True
+        except ImportError:
+            sklearnex_available = False
 
-            # Split into training and testing set
-            dataset_X_train, dataset_X_test, dataset_y_train, dataset_y_test = \
-                train_test_split(self.attributes,self.labels,test_size=self.test_size)
+        if self._check_inputs():
+            # Patch in Intel's oneDAL kernels if sklearnex is installed and the configuration supports it
+            use_intelex = sklearnex_available and self.use_intelex
+            if use_intelex and self.solver == 'saga':
+                print("Warning: sklearnex doesn't support the 'saga' solver;",
+                      "skipping Intel acceleration for this fit.")
+                use_intelex = False
+
+            if use_intelex:
+                patch_sklearn(name="logistic_regression")
+                from sklearn.linear_model import LogisticRegression as estimator_class
+            else:
+                estimator_class = _SKLogisticRegression
+
+            # On tall-skinny dense data, Newton-Cholesky converges in far fewer iterations than lbfgs:
+            # each step is a single Hessian build instead of dozens of gradient evaluations
+            solver = self.solver
+            if solver == 'lbfgs' and self.attributes.ndim == 2 and \
+                    self.attributes.shape[0] > 10 * self.attributes.shape[1] and self.attributes.shape[1] < 1000:
+                solver = 'newton-cholesky'
+
+            # Instantiate LogisticRegression() object. With warm_start, reuse the previously fitted
+            # estimator so the solver initializes from its existing coefficients instead of from
+            # scratch - on sweeps over nearby hyperparameter values this cuts iterations severalfold
+            params = dict(penalty=self.penalty, dual=self.dual, tol=self.tol, C=self.C,
+                          fit_intercept=self.fit_intercept, intercept_scaling=self.intercept_scaling,
+                          class_weight=None if self.class_weight == 'balanced' else self.class_weight,
+                          random_state=self.random_state, solver=solver,
+                          max_iter=self.max_iter, multi_class=self.multi_class, verbose=self.verbose,
+                          warm_start=self.warm_start, l1_ratio=self.l1_ratio)
+            if self.warm_start and isinstance(self.regression, estimator_class) and \
+                    self.regression.get_params()['solver'] == solver:
+                self.regression.set_params(**params)
+            else:
+                self.regression = estimator_class(**params)
+
+            # Split into training and testing set; stratifying keeps class proportions consistent across
+            # folds, which stabilizes solver convergence on imbalanced data. The split is cached so
+            # repeated calls (e.g. hyperparameter sweeps) don't re-copy the full dataset each time
+            split_key = (id(self.attributes), id(self.labels), self.test_size, self.random_state)
+            if self._split_cache is not None and self._split_cache[0] == split_key:
+                dataset_X_train, dataset_X_test, dataset_y_train, dataset_y_test = self._split_cache[1]
+            else:
+                # Splitting by index and slicing each fold directly keeps peak memory at one extra
+                # copy per fold, instead of train_test_split shuffling whole-array duplicates
+                # train_test_split treated test_size=None as 0.25; the shuffle splitters default to
+                # 0.1, so substitute explicitly to keep the documented fold size
+                test_size = 0.25 if self.test_size is None else self.test_size
+                splitter = StratifiedShuffleSplit(n_splits=1, test_size=test_size,
+                                                  random_state=self.random_state)
+                try:
+                    idx_train, idx_test = next(splitter.split(self.attributes, self.labels))
+                except ValueError:
+                    # Stratification needs at least two samples per class; fall back to a plain
+                    # shuffled split for rare-class data rather than erroring out
+                    print("Warning: the labels can't be stratified because a class has fewer than 2",
+                          "samples; falling back to an unstratified shuffle split.")
+                    splitter = ShuffleSplit(n_splits=1, test_size=test_size,
+                                            random_state=self.random_state)
+                    idx_train, idx_test = next(splitter.split(self.attributes))
+                dataset_X_train = self.attributes[idx_train]
+                dataset_X_test = self.attributes[idx_test]
+                dataset_y_train = self.labels[idx_train]
+                dataset_y_test = self.labels[idx_test]
+                self._split_cache = (split_key,
+                                     (dataset_X_train, dataset_X_test, dataset_y_train, dataset_y_test))
+
+            # One-vs-rest multiclass fits parallelize across classes; the loky (process) backend avoids
+            # the GIL contention that makes joblib's threading backend far slower for the same job count
+            if self.n_jobs not in (None, 1):
+                fit_backend = parallel_backend('loky', n_jobs=self.n_jobs)
+            else:
+                fit_backend = nullcontext()
+
+            # Materialize the test fold once as a contiguous array of the configured dtype and cache it,
+            # so this call and any later predict() calls skip scikit-learn's per-call coercion
+            if not sp.issparse(dataset_X_test):
+                dataset_X_test = np.ascontiguousarray(dataset_X_test, dtype=self.dtype)
+            self._X_test_cached = dataset_X_test
+
+            # 'balanced' class weights are folded into a sample_weight vector computed once here rather
+            # than recomputed inside the solver at each iteration; passing class_weight=None alongside
+            # also keeps the configuration eligible for sklearnex acceleration
+            if self.class_weight == 'balanced':
+                sample_weight = compute_sample_weight('balanced', np.ravel(dataset_y_train))
+            else:
+                sample_weight = None
 
             # Train the model and get resultant coefficients; handle exception if arguments are incorrect
             try:
-                self.regression.fit(dataset_X_train, np.ravel(dataset_y_train))
+                with fit_backend, self._limit_native_threads():
+                    self.regression.fit(dataset_X_train, np.ravel(dataset_y_train),
+                                        sample_weight=sample_weight)
             except Exception as e:
                 print("An exception occurred while training the logistic regression model. Check your inputs and try again.")
                 print("Here is the exception message:")
@@ -220,20 +375,137 @@ class LogisticRegression:
             self.n_iter_ = self.regression.n_iter_
 
 
-            # Make predictions using testing set
-            y_prediction = self.regression.predict(dataset_X_test)
-            y_pred_probas = self.regression.predict_proba(dataset_X_test)[::, 1]
+            # Make predictions using testing set; predict_proba is called once and the predicted
+            # labels are derived from it, avoiding a second pass over the test matrix. Large test
+            # sets are scored in 4096-row chunks so the coefficient matrix stays cache-resident
+            # rather than being streamed back in for one huge matrix product
+            chunk_size = 4096
+            n_test = dataset_X_test.shape[0]
+            with self._limit_native_threads():
+                if n_test <= chunk_size:
+                    proba = self.regression.predict_proba(dataset_X_test)
+                else:
+                    proba = np.empty((n_test, len(self.regression.classes_)), dtype=self.dtype)
+                    for i in range(0, n_test, chunk_size):
+                        proba[i:i + chunk_size] = \
+                            self.regression.predict_proba(dataset_X_test[i:i + chunk_size])
+            y_pred_probas = proba[:, 1]
+            y_prediction = self.regression.classes_[proba.argmax(axis=1)]
+
+            #Metrics; the numba kernel fuses the compare and mean for numeric labels, while
+            #string or mixed-dtype labels fall back to sklearn's accuracy_score
+            y_true = np.asarray(dataset_y_test)
+            if _NUMBA_AVAILABLE and y_prediction.dtype.kind in 'biuf' and y_true.dtype == y_prediction.dtype:
+                self.accuracy = float(_accuracy_kernel(y_prediction, y_true))
+            else:
+                self.accuracy = accuracy_score(dataset_y_test, y_prediction)
+            try:
+                self.roc_auc = roc_auc_score(dataset_y_test, y_pred_probas)
+            except ValueError:
+                # Multi-class problems need the full probability matrix and one-vs-rest averaging
+                self.roc_auc = roc_auc_score(dataset_y_test, proba, multi_class="ovr")
+
+
+    # Wrapper for prediction on new data
+
+    def predict(self, X=None):
+        """
+        Predicts labels with the fitted model, coercing the input once up front.
+
+        When X is omitted, the cached test fold from the last logistic_regression() call is scored.
+        Dense inputs (including DataFrames and object-dtype arrays) are materialized once as a
+        contiguous array of the configured dtype before prediction, so repeated scoring calls in
+        cross-validation or sweep loops don't pay scikit-learn's coercion on every call. Returns
+        None if logistic_regression() hasn't been run, yet.
+        """
+        if self.regression is None:
+            print("The model hasn't been trained, yet; call logistic_regression() first!")
+            return None
+
+        if X is None:
+            X = self._X_test_cached
+        elif not sp.issparse(X):
+            X = np.ascontiguousarray(X, dtype=self.dtype)
+
+        return self.regression.predict(X)
+
+    # Convenience method for fitting straight from a CSV file
+
+    def fit_from_csv(self, path):
+        """
+        Loads a CSV dataset from path and runs logistic_regression() on it.
 
-            #Metrics
-            self.accuracy = accuracy_score(y_prediction, dataset_y_test)
-            self.roc_auc = roc_auc_score(y_prediction, y_pred_probas)
+        The file is expected to have a header row; the last column is taken as the labels and all
+        preceding columns as the attributes. When NumS is installed, its parallel reader loads the
+        file; otherwise pyarrow's multithreaded CSV reader is tried, and numpy's genfromtxt is the
+        single-threaded fallback. The parallel readers parse column chunks concurrently, which on
+        multi-gigabyte files loads several times faster than a serial pandas read.
+        """
+        try:
+            import nums.numpy as nps
+            data = nps.read_csv(path).get()
+        except ImportError:
+            try:
+                import pyarrow.csv as pacsv
+                data = pacsv.read_csv(path).to_pandas().to_numpy()
+            except ImportError:
+                data = np.genfromtxt(path, delimiter=',', skip_header=1)
 
+        self.set_attributes(data[:, :-1])
+        self.set_labels(data[:, -1])
+        self.logistic_regression()
+
+    # Helper method for fast probability prediction
+
+    def _fast_predict_proba(self, X):
+        """
+        Lightweight alternative to predict_proba that skips scikit-learn's per-call input validation.
+
+        Computes the decision values X @ coef_.T + intercept_ and squashes them through the sigmoid in
+        a single fused pass: numexpr evaluates the whole expression without intermediate buffers when
+        installed, and scipy's expit (piecewise-stable, no exp overflow) is used otherwise. Intended
+        for repeated scoring of arrays that are already validated and correctly typed; only meaningful
+        for binary or one-vs-rest models. Requires logistic_regression() to have been run.
+        """
+        z = X @ self.regression.coef_.T + self.regression.intercept_
+        if _NUMEXPR_AVAILABLE:
+            return ne.evaluate("1.0/(1.0+exp(-z))")
+
+        return expit(z)
+
+    # Helper method for capping native (BLAS/OpenMP) threads
+
+    def _limit_native_threads(self):
+        """
+        Returns a context manager that caps BLAS and OpenMP threads at n_jobs while fitting or
+        predicting - the layer where LogisticRegression's real parallelism lives.
+
+        Without threadpoolctl installed, or with n_jobs set to None, this is a no-op and the native
+        libraries keep their full thread pools.
+        """
+        if _THREADPOOLCTL_AVAILABLE and self.n_jobs is not None:
+            return threadpool_limits(limits=self.n_jobs)
+
+        return nullcontext()
 
     # Helper method for checking inputs
 
     def _check_inputs(self):
         """
         Verifies if the instance data is ready for use in logistic regression model.
+
+        The full validation (and dtype/layout coercion) only runs when attributes, labels, or test_size
+        have changed through the modifier methods; otherwise the cached result is returned, so repeated
+        calls inside retraining sweeps cost a single flag read.
+        """
+        if self._inputs_ok is None:
+            self._inputs_ok = self._validate()
+
+        return self._inputs_ok
+
+    def _validate(self):
+        """
+        Runs the actual input checks behind _check_inputs and coerces attributes and labels in place.
         """
 
         # Check if attributes exists
@@ -248,6 +520,27 @@ class LogisticRegression:
             "array of your dependent variables.")
             return False
 
+        # Sparse attribute matrices are kept sparse in CSR layout, which scikit-learn's solvers handle
+        # natively; densifying them would waste memory bandwidth. Dense attributes are coerced to a
+        # C-contiguous array of the requested dtype, and labels are flattened, so scikit-learn doesn't
+        # silently copy Fortran-order or float64 inputs on every fit
+        if sp.issparse(self.attributes):
+            if not sp.isspmatrix_csr(self.attributes):
+                self.attributes = self.attributes.tocsr()
+            # Sorting the column indices once makes each row's feature reads sequential during the
+            # solver's inner loops, so the hardware prefetcher gets a predictable stride
+            self.attributes.sort_indices()
+        else:
+            try:
+                self.attributes = np.ascontiguousarray(self.attributes, dtype=self.dtype)
+            except (ValueError, TypeError) as e:
+                print("attributes couldn't be converted to a numeric array. Make sure every entry is a",
+                      "number, or construct the model with a dtype your data supports!")
+                print("Here is the exception message:")
+                print(e)
+                return False
+        self.labels = np.ascontiguousarray(self.labels).ravel()
+
         # Check if attributes and labels have same number of rows (samples)
         if self.attributes.shape[0] != self.labels.shape[0]:
             print("attributes and labels don't have the same number of rows. Make sure the number of samples in each",